@@ -113,6 +113,7 @@ class Completer( with_metaclass( abc.ABCMeta, object ) ):
             filetype_set = set( self.SupportedFiletypes() ) )
         if user_options[ 'auto_trigger' ] else None )
     self._completions_cache = CompletionsCache()
+    self._subcommands_map = None
 
 
   def CompletionType( self, request_data ):
@@ -196,7 +197,15 @@ class Completer( with_metaclass( abc.ABCMeta, object ) ):
 
 
   def DefinedSubcommands( self ):
-    return sorted( self.GetSubcommandsMap().keys() )
+    return sorted( self._GetSubcommandsMapOnce().keys() )
+
+
+  def _GetSubcommandsMapOnce( self ):
+    # GetSubcommandsMap builds a new dictionary of lambdas on each call, so we
+    # only call it the first time a subcommand is needed.
+    if self._subcommands_map is None:
+      self._subcommands_map = self.GetSubcommandsMap()
+    return self._subcommands_map
 
 
   def GetSubcommandsMap( self ):
@@ -270,7 +279,7 @@ class Completer( with_metaclass( abc.ABCMeta, object ) ):
     if not arguments:
       raise ValueError( self.UserCommandsHelpMessage() )
 
-    command_map = self.GetSubcommandsMap()
+    command_map = self._GetSubcommandsMapOnce()
 
     try:
       command = command_map[ arguments[ 0 ] ]
@@ -649,13 +649,8 @@ def _FixLineEndings( old_buffer, new_buffer ):
   return new_buffer
 
 
-# Adapted from http://stackoverflow.com/a/24495900
 def _IndexToLineColumn( text, index ):
-  """Get (line_number, col) of `index` in `string`."""
-  lines = text.splitlines( True )
-  curr_pos = 0
-  for linenum, line in enumerate( lines ):
-    if curr_pos + len( line ) > index:
-      return linenum + 1, index - curr_pos + 1
-    curr_pos += len( line )
-  assert False
+  """Get (line_number, col) of `index` in `string`. Only '\n' ends a line, which
+  also covers '\r\n' line endings."""
+  line_start = text.rfind( '\n', 0, index ) + 1
+  return text.count( '\n', 0, index ) + 1, index - line_start + 1
@@ -69,13 +69,13 @@ def FindBinary( binary, user_options ):
   If the resolved binary exists, return the path,
   otherwise return None. """
 
-  def _FindPath():
-    key = '{0}_binary_path'.format( binary )
-    if user_options.get( key ):
-      return user_options[ key ]
-    return GO_BINARIES.get( binary )
+  key = '{0}_binary_path'.format( binary )
+  return _FindBinary( binary, user_options.get( key ) )
 
-  binary_path = _FindPath()
+
+@utils.Memoize
+def _FindBinary( binary, user_binary_path ):
+  binary_path = user_binary_path or GO_BINARIES.get( binary )
   if os.path.isfile( binary_path ):
     return binary_path
   return None
@@ -106,7 +106,7 @@ class GoCompleter( Completer ):
 
   def ComputeCandidatesInner( self, request_data ):
     filename = request_data[ 'filepath' ]
-    _logger.info( "gocode completion request %s" % filename )
+    _logger.info( "gocode completion request %s", filename )
     if not filename:
       return
 
@@ -192,7 +192,7 @@ class GoCompleter( Completer ):
   def _GoToDefinition( self, request_data ):
     try:
       filename = request_data[ 'filepath' ]
-      _logger.info( "godef GoTo request %s" % filename )
+      _logger.info( "godef GoTo request %s", filename )
       if not filename:
         return
       contents = utils.ToBytes(
@@ -220,21 +220,26 @@ class GoCompleter( Completer ):
     raise RuntimeError( 'Can\'t jump to definition.' )
 
 
-# Compute the byte offset in the file given the line and column.
-# TODO(ekfriis): If this is slow, consider moving this to C++ ycm_core,
-# perhaps in RequestWrap.
+# Compute the byte offset in the file given the line and column. Newlines are
+# located with bytes.find so that the buffer is scanned in C rather than one
+# byte at a time in Python.
 def _ComputeOffset( contents, line, col ):
   contents = ToBytes( contents )
-  curline = 1
-  curcol = 1
-  newline = bytes( b'\n' )[ 0 ]
-  for i, byte in enumerate( contents ):
-    if curline == line and curcol == col:
-      return i
-    curcol += 1
-    if byte == newline:
-      curline += 1
-      curcol = 1
+  newline = bytes( b'\n' )
+  if line >= 1 and col >= 1:
+    line_start = 0
+    for _ in range( line - 1 ):
+      line_start = contents.find( newline, line_start ) + 1
+      if not line_start:
+        break
+    else:
+      # The column may point at the newline ending the line but not past it.
+      line_end = contents.find( newline, line_start )
+      if line_end == -1:
+        line_end = len( contents ) - 1
+      offset = line_start + col - 1
+      if offset <= line_end:
+        return offset
   _logger.error( 'GoCode completer - could not compute byte offset ' +
                  'corresponding to L%i C%i', line, col )
   return -1
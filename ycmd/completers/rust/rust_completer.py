@@ -74,7 +74,11 @@ def FindRacerdBinary( user_options ):
   user_options if available. It then falls back to ycmd's racerd build. If
   that's not found, attempts to use racerd from current path.
   """
-  racerd_user_binary = user_options.get( 'racerd_binary_path' )
+  return _FindRacerdBinary( user_options.get( 'racerd_binary_path' ) )
+
+
+@utils.Memoize
+def _FindRacerdBinary( racerd_user_binary ):
   if racerd_user_binary:
     # The user has explicitly specified a path.
     if os.path.isfile( racerd_user_binary ):
@@ -24,6 +24,7 @@ from future import standard_library
 standard_library.install_aliases()
 from builtins import *  # noqa
 
+import hashlib
 import json
 import logging
 import os
@@ -51,18 +52,22 @@ _logger = logging.getLogger( __name__ )
 
 class DeferredResponse( object ):
   """
-  A deferred that resolves to a response from TSServer.
+  A deferred that resolves to a response from TSServer. If a callback is
+  supplied, it is called with the response message when it is resolved.
   """
 
-  def __init__( self, timeout = RESPONSE_TIMEOUT_SECONDS ):
+  def __init__( self, timeout = RESPONSE_TIMEOUT_SECONDS, callback = None ):
     self._event = Event()
     self._message = None
     self._timeout = timeout
+    self._callback = callback
 
 
   def resolve( self, message ):
     self._message = message
     self._event.set()
+    if self._callback:
+      self._callback( message )
 
 
   def result( self ):
@@ -122,12 +127,16 @@ class TypeScriptCompleter( Completer ):
     # https://github.com/Microsoft/TypeScript/issues/3403
     # TODO: remove this option when the issue is fixed.
     # We also need to redirect the error stream to the output one on Windows.
+    # The pipes are fully buffered so that the reader thread gets as many
+    # messages as are available with each read from the pipe; Popen defaults to
+    # unbuffered pipes on Python 2, which reads one byte at a time.
     self._tsserver_handle = utils.SafePopen( binarypath,
                                              stdout = subprocess.PIPE,
                                              stdin = subprocess.PIPE,
                                              stderr = subprocess.STDOUT,
                                              env = self._environ,
-                                             universal_newlines = True )
+                                             universal_newlines = True,
+                                             bufsize = -1 )
 
     # Used to map sequence id's to their corresponding DeferredResponse
     # objects. The reader loop uses this to hand out responses.
@@ -137,6 +146,19 @@ class TypeScriptCompleter( Completer ):
     # the pending response dictionary
     self._pendinglock = Lock()
 
+    # Used to map filenames to a hash of the contents last sent to TSServer.
+    # This lets us skip reloading a file that hasn't changed since.
+    self._reloaded_hashes = {}
+
+    # Used to update the hashes above in the same order as the requests that
+    # change TSServer's view of a file are written.
+    self._reloadlock = Lock()
+
+    # Used to prevent threads from concurrently modifying the hashes above. The
+    # reader thread only takes this lock, never the one above, so it can't wait
+    # on a thread that is blocked writing to TSServer.
+    self._hashlock = Lock()
+
     # Start a thread to read response from TSServer.
     self._thread = Thread( target = self._ReaderLoop, args = () )
     self._thread.daemon = True
@@ -159,7 +181,7 @@ class TypeScriptCompleter( Completer ):
         msgtype = message[ 'type' ]
         if msgtype == 'event':
           eventname = message[ 'event' ]
-          _logger.info( 'Recieved {0} event from tsserver'.format( eventname ) )
+          _logger.info( 'Received %s event from tsserver', eventname )
           continue
         if msgtype != 'response':
           _logger.error( 'Unsuported message type {0}'.format( msgtype ) )
@@ -167,9 +189,9 @@ class TypeScriptCompleter( Completer ):
 
         seq = message[ 'request_seq' ]
         with self._pendinglock:
-          if seq in self._pending:
-            self._pending[ seq ].resolve( message )
-            del self._pending[ seq ]
+          deferred = self._pending.pop( seq, None )
+        if deferred:
+          deferred.resolve( message )
       except Exception as e:
         _logger.error( 'ReaderLoop error: {0}'.format( str( e ) ) )
 
@@ -219,10 +241,7 @@ class TypeScriptCompleter( Completer ):
     """
 
     request = self._BuildRequest( command, arguments )
-    with self._writelock:
-      self._tsserver_handle.stdin.write( json.dumps( request ) )
-      self._tsserver_handle.stdin.write( "\n" )
-      self._tsserver_handle.stdin.flush()
+    self._WriteRequest( request )
 
 
   def _SendRequest( self, command, arguments = None ):
@@ -231,16 +250,34 @@ class TypeScriptCompleter( Completer ):
     for the response.
     """
 
+    return self._SendDeferredRequest( command, arguments ).result()
+
+
+  def _SendDeferredRequest( self, command, arguments = None, callback = None ):
+    """
+    Send a request message to TSServer but don't wait for the response.
+    Return the DeferredResponse that the response will resolve; the optional
+    callback is called with the response from the reader thread.
+    """
+
     request = self._BuildRequest( command, arguments )
-    deferred = DeferredResponse()
+    deferred = DeferredResponse( callback = callback )
     with self._pendinglock:
       seq = request[ 'seq' ]
       self._pending[ seq ] = deferred
+    self._WriteRequest( request )
+    return deferred
+
+
+  def _WriteRequest( self, request ):
+    """Write a request message to TSServer's stdin."""
+
+    # The message and its newline terminator are written in a single call; the
+    # pipe is buffered, so the flush below sends them to TSServer together.
+    payload = json.dumps( request ) + '\n'
     with self._writelock:
-      self._tsserver_handle.stdin.write( json.dumps( request ) )
-      self._tsserver_handle.stdin.write( "\n" )
+      self._tsserver_handle.stdin.write( payload )
       self._tsserver_handle.stdin.flush()
-    return deferred.result()
 
 
   def _Reload( self, request_data ):
@@ -250,15 +287,39 @@ class TypeScriptCompleter( Completer ):
     """
 
     filename = request_data[ 'filepath' ]
-    contents = request_data[ 'file_data' ][ filename ][ 'contents' ]
-    tmpfile = NamedTemporaryFile( delete = False )
-    tmpfile.write( utils.ToBytes( contents ) )
-    tmpfile.close()
-    self._SendRequest( 'reload', {
-      'file':    filename,
-      'tmpfile': tmpfile.name
-    } )
-    os.unlink( tmpfile.name )
+    contents = utils.ToBytes(
+      request_data[ 'file_data' ][ filename ][ 'contents' ] )
+    contents_hash = hashlib.sha1( contents ).digest()
+
+    def OnReloaded( message ):
+      os.unlink( tmpfile.name )
+      if not message[ 'success' ]:
+        _logger.error( 'Failed to reload %s: %s', filename,
+                       message.get( 'message' ) )
+        # Another reload or an open/close may have been sent since.
+        with self._hashlock:
+          if self._reloaded_hashes.get( filename ) == contents_hash:
+            del self._reloaded_hashes[ filename ]
+
+    with self._reloadlock:
+      if self._reloaded_hashes.get( filename ) == contents_hash:
+        return
+
+      tmpfile = NamedTemporaryFile( delete = False )
+      tmpfile.write( contents )
+      tmpfile.close()
+
+      # The hash is recorded as soon as the reload is written, since that is
+      # when TSServer's view of the file changes. TSServer handles requests in
+      # the order they are sent, so we don't wait for the reload to complete:
+      # the request that follows it will only be answered once the file is up
+      # to date.
+      with self._hashlock:
+        self._reloaded_hashes[ filename ] = contents_hash
+      self._SendDeferredRequest( 'reload', {
+        'file':    filename,
+        'tmpfile': tmpfile.name
+      }, callback = OnReloaded )
 
 
   def SupportedFiletypes( self ):
@@ -312,12 +373,19 @@ class TypeScriptCompleter( Completer ):
 
   def OnBufferVisit( self, request_data ):
     filename = request_data[ 'filepath' ]
-    self._SendCommand( 'open', { 'file': filename } )
+    # Opening or closing a file may make TSServer read it again from disk.
+    with self._reloadlock:
+      with self._hashlock:
+        self._reloaded_hashes.pop( filename, None )
+      self._SendCommand( 'open', { 'file': filename } )
 
 
   def OnBufferUnload( self, request_data ):
     filename = request_data[ 'filepath' ]
-    self._SendCommand( 'close', { 'file': filename } )
+    with self._reloadlock:
+      with self._hashlock:
+        self._reloaded_hashes.pop( filename, None )
+      self._SendCommand( 'close', { 'file': filename } )
 
 
   def OnFileReadyToParse( self, request_data ):
@@ -509,7 +577,6 @@ def _BuildFixItChunksForFile( new_name, file_replacement ):
   # whereas all other paths in Python are of the C:\\blah\\blah form. We use
   # normpath to have python do the conversion for us.
   file_path = os.path.normpath( file_replacement[ 'file' ] )
-  _logger.debug( 'Converted {0} to {1}'.format( file_replacement[ 'file' ],
-                                                file_path ) )
+  _logger.debug( 'Converted %s to %s', file_replacement[ 'file' ], file_path )
   return [ _BuildFixItChunkForRange( new_name, file_path, r )
            for r in file_replacement[ 'locs' ] ]
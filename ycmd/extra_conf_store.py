@@ -40,14 +40,14 @@ from fnmatch import fnmatch
 # Singleton variables
 _module_for_module_file = {}
 _module_for_module_file_lock = Lock()
-_module_file_for_source_file = {}
-_module_file_for_source_file_lock = Lock()
+_module_file_for_source_folder = {}
+_module_file_for_source_folder_lock = Lock()
 
 
 def Reset():
-  global _module_for_module_file, _module_file_for_source_file
+  global _module_for_module_file, _module_file_for_source_folder
   _module_for_module_file = {}
-  _module_file_for_source_file = {}
+  _module_file_for_source_folder = {}
 
 
 def ModuleForSourceFile( filename ):
@@ -57,16 +57,20 @@ def ModuleForSourceFile( filename ):
 def ModuleFileForSourceFile( filename ):
   """This will try all files returned by _ExtraConfModuleSourceFilesForFile in
   order and return the filename of the first module that was allowed to load.
-  If no module was found or allowed to load, None is returned."""
+  If no module was found or allowed to load, None is returned.
 
-  with _module_file_for_source_file_lock:
-    if filename not in _module_file_for_source_file:
+  The search only depends on the folder containing the file, so its result is
+  cached per folder; other files in the same folder don't search again."""
+
+  folder = os.path.dirname( filename )
+  with _module_file_for_source_folder_lock:
+    if folder not in _module_file_for_source_folder:
       for module_file in _ExtraConfModuleSourceFilesForFile( filename ):
         if Load( module_file ):
-          _module_file_for_source_file[ filename ] = module_file
+          _module_file_for_source_folder[ folder ] = module_file
           break
 
-  return _module_file_for_source_file.setdefault( filename )
+  return _module_file_for_source_folder.setdefault( folder )
 
 
 def CallGlobalExtraConfYcmCorePreloadIfExists():
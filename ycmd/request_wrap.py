@@ -69,10 +69,16 @@ class RequestWrap( object ):
     current_file = self._request[ 'filepath' ]
     contents = self._request[ 'file_data' ][ current_file ][ 'contents' ]
 
-    # Handling ''.splitlines() returning [] instead of ['']
-    if contents is not None and len( contents ) == 0:
-      return ''
-    return contents.splitlines()[ self._request[ 'line_num' ] - 1 ]
+    # Only split as far as the current line; the rest of the buffer is left in
+    # the last item. Unlike splitlines(), this only breaks lines on '\n', like
+    # the client does.
+    line_num = self._request[ 'line_num' ]
+    lines = contents.split( '\n', line_num )
+    if len( lines ) < line_num:
+      raise IndexError( 'line_num is past the end of the file' )
+    line = lines[ line_num - 1 ]
+    # Handle Windows line endings.
+    return line[ : -1 ] if line.endswith( '\r' ) else line
 
 
   def CompletionStartColumn( self ):
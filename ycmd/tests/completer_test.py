@@ -15,6 +15,7 @@
 # You should have received a copy of the GNU General Public License
 # along with ycmd.  If not, see <http://www.gnu.org/licenses/>.
 
+from mock import patch
 from ycmd.tests.test_utils import DummyCompleter
 from ycmd.user_options_store import DefaultOptions
 from nose.tools import eq_
@@ -48,3 +49,13 @@ def FilterAndSortCandidates_ServerCompleter_test():
   _FilterAndSortCandidates_Match( [ { 'insertion_text': 'password' } ],
                                   'p',
                                   [ { 'insertion_text': 'password' } ] )
+
+
+@patch( 'ycmd.tests.test_utils.DummyCompleter.GetSubcommandsMap',
+        return_value = { 'A': lambda self, request_data, args: args } )
+def OnUserCommand_BuildsSubcommandsMapOnce_test( get_subcommands_map ):
+  completer = DummyCompleter( DefaultOptions() )
+  eq_( [ 'B' ], completer.OnUserCommand( [ 'A', 'B' ], {} ) )
+  eq_( [ 'C' ], completer.OnUserCommand( [ 'A', 'C' ], {} ) )
+  eq_( [ 'A' ], completer.DefinedSubcommands() )
+  eq_( 1, get_subcommands_map.call_count )
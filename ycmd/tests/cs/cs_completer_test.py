@@ -0,0 +1,56 @@
+# Copyright (C) 2016 ycmd contributors
+#
+# This file is part of ycmd.
+#
+# ycmd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ycmd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ycmd.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+from builtins import *  # noqa
+
+from nose.tools import eq_
+
+from ycmd.completers.cs.cs_completer import _IndexToLineColumn
+
+
+def IndexToLineColumn_UnixLines_test():
+  text = 'ab\ncd\n\nx'
+  eq_( ( 1, 1 ), _IndexToLineColumn( text, 0 ) )
+  # The newline belongs to the line it ends.
+  eq_( ( 1, 3 ), _IndexToLineColumn( text, 2 ) )
+  eq_( ( 2, 2 ), _IndexToLineColumn( text, 4 ) )
+  eq_( ( 3, 1 ), _IndexToLineColumn( text, 6 ) )
+  eq_( ( 4, 1 ), _IndexToLineColumn( text, 7 ) )
+
+
+def IndexToLineColumn_WindowsLines_test():
+  text = 'ab\r\ncd\r\nx'
+  eq_( ( 1, 3 ), _IndexToLineColumn( text, 2 ) )
+  eq_( ( 1, 4 ), _IndexToLineColumn( text, 3 ) )
+  eq_( ( 2, 1 ), _IndexToLineColumn( text, 4 ) )
+  eq_( ( 3, 1 ), _IndexToLineColumn( text, 8 ) )
+
+
+def IndexToLineColumn_EndOfBuffer_test():
+  eq_( ( 2, 3 ), _IndexToLineColumn( 'ab\ncd', 5 ) )
+  eq_( ( 3, 1 ), _IndexToLineColumn( 'ab\ncd\n', 6 ) )
+  eq_( ( 1, 1 ), _IndexToLineColumn( '', 0 ) )
+
+
+def IndexToLineColumn_OnlyNewlinesEndLines_test():
+  eq_( ( 1, 4 ), _IndexToLineColumn( 'ab\rcd', 3 ) )
@@ -0,0 +1,75 @@
+# Copyright (C) 2016  ycmd contributors.
+#
+# This file is part of ycmd.
+#
+# ycmd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ycmd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ycmd.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+from builtins import *  # noqa
+
+import os
+from mock import patch
+from nose.tools import eq_
+from ycmd import extra_conf_store
+
+MODULE_FILE = os.path.join( os.sep, 'foo', '.ycm_extra_conf.py' )
+
+
+@patch( 'ycmd.extra_conf_store.Load', return_value = True )
+@patch( 'ycmd.extra_conf_store._ExtraConfModuleSourceFilesForFile',
+        return_value = [ MODULE_FILE ] )
+def ModuleFileForSourceFile_CachedPerFolder_test( source_files, *args ):
+  extra_conf_store.Reset()
+  try:
+    eq_( MODULE_FILE, extra_conf_store.ModuleFileForSourceFile(
+      os.path.join( os.sep, 'foo', 'a.c' ) ) )
+    eq_( MODULE_FILE, extra_conf_store.ModuleFileForSourceFile(
+      os.path.join( os.sep, 'foo', 'b.c' ) ) )
+    eq_( 1, source_files.call_count )
+
+    extra_conf_store.Reset()
+    eq_( MODULE_FILE, extra_conf_store.ModuleFileForSourceFile(
+      os.path.join( os.sep, 'foo', 'b.c' ) ) )
+    eq_( 2, source_files.call_count )
+  finally:
+    extra_conf_store.Reset()
+
+
+@patch( 'ycmd.extra_conf_store._ExtraConfModuleSourceFilesForFile',
+        return_value = [] )
+def ModuleFileForSourceFile_NoModuleCachedPerFolder_test( source_files ):
+  extra_conf_store.Reset()
+  try:
+    eq_( None, extra_conf_store.ModuleFileForSourceFile(
+      os.path.join( os.sep, 'foo', 'a.c' ) ) )
+    eq_( None, extra_conf_store.ModuleFileForSourceFile(
+      os.path.join( os.sep, 'foo', 'b.c' ) ) )
+    eq_( 1, source_files.call_count )
+
+    # A file in another folder searches again.
+    eq_( None, extra_conf_store.ModuleFileForSourceFile(
+      os.path.join( os.sep, 'bar', 'a.c' ) ) )
+    eq_( 2, source_files.call_count )
+
+    extra_conf_store.Reset()
+    eq_( None, extra_conf_store.ModuleFileForSourceFile(
+      os.path.join( os.sep, 'foo', 'a.c' ) ) )
+    eq_( 3, source_files.call_count )
+  finally:
+    extra_conf_store.Reset()
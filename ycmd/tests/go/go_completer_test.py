@@ -27,7 +27,8 @@ from builtins import *  # noqa
 
 import os
 from nose.tools import eq_, raises
-from ycmd.completers.go.go_completer import GoCompleter, GO_BINARIES, FindBinary
+from ycmd.completers.go.go_completer import ( _ComputeOffset, GoCompleter,
+                                              GO_BINARIES, FindBinary )
 from ycmd.request_wrap import RequestWrap
 from ycmd import user_options_store
 from ycmd.utils import ReadFile
@@ -79,6 +80,20 @@ class GoCompleter_test( object ):
     eq_( None, FindBinary( "gocode", user_options ) )
 
 
+  def ComputeOffset_test( self ):
+    contents = 'ab\ncd\n\nx'
+    eq_( 0, _ComputeOffset( contents, 1, 1 ) )
+    # The column of the newline itself is valid.
+    eq_( 2, _ComputeOffset( contents, 1, 3 ) )
+    eq_( 4, _ComputeOffset( contents, 2, 2 ) )
+    eq_( 6, _ComputeOffset( contents, 3, 1 ) )
+    eq_( 7, _ComputeOffset( contents, 4, 1 ) )
+    # Past the end of a line, past the last line and past the end of file.
+    eq_( -1, _ComputeOffset( contents, 1, 4 ) )
+    eq_( -1, _ComputeOffset( contents, 5, 1 ) )
+    eq_( -1, _ComputeOffset( contents, 4, 2 ) )
+
+
   # Test line-col to offset in the file before any unicode occurrences.
   def ComputeCandidatesInnerOffsetBeforeUnicode_test( self ):
     mock = MockPopen( returncode = 0,
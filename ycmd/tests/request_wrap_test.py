@@ -77,6 +77,20 @@ def LineValue_MixedFormatLines_test():
                        contents = 'goo\nbar\r\nzoo' ) )[ 'line_value' ] )
 
 
+def LineValue_WindowsMiddleLine_test():
+  eq_( 'bar',
+       RequestWrap(
+          PrepareJson( line_num = 2,
+                       contents = 'goo\r\nbar\r\nzoo' ) )[ 'line_value' ] )
+
+
+def LineValue_OnlyNewlinesSplitLines_test():
+  eq_( 'bar\x0cbaz',
+       RequestWrap(
+          PrepareJson( line_num = 2,
+                       contents = 'goo\nbar\x0cbaz\nzoo' ) )[ 'line_value' ] )
+
+
 def LineValue_EmptyContents_test():
   eq_( '',
        RequestWrap( PrepareJson( line_num = 1,
@@ -0,0 +1,162 @@
+# Copyright (C) 2016 ycmd contributors
+#
+# This file is part of ycmd.
+#
+# ycmd is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# ycmd is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with ycmd.  If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import unicode_literals
+from __future__ import print_function
+from __future__ import division
+from __future__ import absolute_import
+from future import standard_library
+standard_library.install_aliases()
+from builtins import *  # noqa
+
+from mock import patch
+from nose.tools import eq_
+
+from ycmd import user_options_store
+from ycmd.completers.typescript.typescript_completer import (
+  TypeScriptCompleter )
+
+TEST_FILE = '/foo.ts'
+
+
+class DeferredRequests( object ):
+  """Stands in for TypeScriptCompleter._SendDeferredRequest and records the
+  requests instead of sending them to TSServer."""
+
+  def __init__( self ):
+    self.requests = []
+
+
+  def __call__( self, command, arguments = None, callback = None ):
+    self.requests.append( ( command, arguments, callback ) )
+
+
+  def Resolve( self, index, success = True ):
+    callback = self.requests[ index ][ 2 ]
+    callback( { 'success': success, 'message': 'error' } )
+
+
+def BuildCompleter():
+  with patch( 'ycmd.utils.PathToFirstExistingExecutable',
+              return_value = 'tsserver' ):
+    with patch( 'ycmd.utils.SafePopen' ):
+      with patch( 'ycmd.completers.typescript.typescript_completer.Thread' ):
+        with patch( 'ycmd.completers.typescript.typescript_completer.'
+                    '_LogFileName', return_value = 'tsserver.log' ):
+          completer = TypeScriptCompleter(
+            user_options_store.DefaultOptions() )
+  deferred_requests = DeferredRequests()
+  completer._SendDeferredRequest = deferred_requests
+  return completer, deferred_requests
+
+
+def BuildRequest( contents ):
+  return {
+    'filepath': TEST_FILE,
+    'file_data': {
+      TEST_FILE: {
+        'contents': contents,
+        'filetypes': [ 'typescript' ]
+      }
+    }
+  }
+
+
+def Reload_SkipsUnchangedContents_test():
+  completer, deferred_requests = BuildCompleter()
+  completer._Reload( BuildRequest( 'x' ) )
+  deferred_requests.Resolve( 0 )
+  completer._Reload( BuildRequest( 'x' ) )
+  eq_( 1, len( deferred_requests.requests ) )
+
+  completer._Reload( BuildRequest( 'y' ) )
+  deferred_requests.Resolve( 1 )
+  eq_( 2, len( deferred_requests.requests ) )
+  eq_( ( 'reload', TEST_FILE ),
+       ( deferred_requests.requests[ 1 ][ 0 ],
+         deferred_requests.requests[ 1 ][ 1 ][ 'file' ] ) )
+
+
+def Reload_SkipsContentsAlreadyBeingReloaded_test():
+  completer, deferred_requests = BuildCompleter()
+  completer._Reload( BuildRequest( 'x' ) )
+  completer._Reload( BuildRequest( 'x' ) )
+  eq_( 1, len( deferred_requests.requests ) )
+  deferred_requests.Resolve( 0 )
+
+
+def Reload_RetriesAfterFailure_test():
+  completer, deferred_requests = BuildCompleter()
+  completer._Reload( BuildRequest( 'x' ) )
+  deferred_requests.Resolve( 0, success = False )
+  completer._Reload( BuildRequest( 'x' ) )
+  eq_( 2, len( deferred_requests.requests ) )
+  deferred_requests.Resolve( 1 )
+
+
+def Reload_AfterBufferVisit_test():
+  completer, deferred_requests = BuildCompleter()
+  completer._Reload( BuildRequest( 'x' ) )
+  deferred_requests.Resolve( 0 )
+  completer.OnBufferVisit( BuildRequest( 'x' ) )
+  completer._Reload( BuildRequest( 'x' ) )
+  eq_( 2, len( deferred_requests.requests ) )
+  deferred_requests.Resolve( 1 )
+
+
+def Reload_AfterBufferUnload_test():
+  completer, deferred_requests = BuildCompleter()
+  completer._Reload( BuildRequest( 'x' ) )
+  deferred_requests.Resolve( 0 )
+  completer.OnBufferUnload( BuildRequest( 'x' ) )
+  completer._Reload( BuildRequest( 'x' ) )
+  eq_( 2, len( deferred_requests.requests ) )
+  deferred_requests.Resolve( 1 )
+
+
+def Reload_PendingReloadOfOtherContents_test():
+  completer, deferred_requests = BuildCompleter()
+  completer._Reload( BuildRequest( 'x' ) )
+  deferred_requests.Resolve( 0 )
+  # TSServer holds 'y' as soon as its reload is sent, so 'x' must be sent again
+  # even though the reload of 'y' hasn't completed yet.
+  completer._Reload( BuildRequest( 'y' ) )
+  completer._Reload( BuildRequest( 'x' ) )
+  eq_( 3, len( deferred_requests.requests ) )
+  deferred_requests.Resolve( 1 )
+  deferred_requests.Resolve( 2 )
+
+
+def Reload_PendingReloadBeforeBufferVisit_test():
+  completer, deferred_requests = BuildCompleter()
+  completer._Reload( BuildRequest( 'x' ) )
+  completer.OnBufferVisit( BuildRequest( 'x' ) )
+  # The reload completing after the open must not mark 'x' as loaded again.
+  deferred_requests.Resolve( 0 )
+  completer._Reload( BuildRequest( 'x' ) )
+  eq_( 2, len( deferred_requests.requests ) )
+  deferred_requests.Resolve( 1 )
+
+
+def Reload_FailedReloadKeepsLaterHash_test():
+  completer, deferred_requests = BuildCompleter()
+  completer._Reload( BuildRequest( 'x' ) )
+  completer._Reload( BuildRequest( 'y' ) )
+  deferred_requests.Resolve( 0, success = False )
+  completer._Reload( BuildRequest( 'y' ) )
+  eq_( 2, len( deferred_requests.requests ) )
+  deferred_requests.Resolve( 1 )
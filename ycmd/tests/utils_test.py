@@ -375,3 +375,17 @@ def OpenForStdHandle_PrintDoesntThrowException_test():
       print( 'foo', file = f )
   finally:
     os.remove( temp )
+
+
+def Memoize_CachesPerArguments_test():
+  calls = []
+
+  @utils.Memoize
+  def Double( value ):
+    calls.append( value )
+    return value * 2
+
+  eq_( Double( 1 ), 2 )
+  eq_( Double( 1 ), 2 )
+  eq_( Double( 2 ), 4 )
+  eq_( calls, [ 1, 2 ] )
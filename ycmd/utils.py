@@ -24,6 +24,7 @@ standard_library.install_aliases()
 from builtins import *  # noqa
 from future.utils import PY2, native
 
+import functools
 import tempfile
 import os
 import sys
@@ -163,6 +164,21 @@ def RemoveIfExists( filename ):
     pass
 
 
+# Decorator caching the result of a function for each distinct tuple of
+# positional arguments, which must therefore be hashable.
+def Memoize( function ):
+  cache = {}
+
+  @functools.wraps( function )
+  def Wrapper( *args ):
+    try:
+      return cache[ args ]
+    except KeyError:
+      result = cache[ args ] = function( *args )
+      return result
+  return Wrapper
+
+
 def PathToFirstExistingExecutable( executable_name_list ):
   for executable_name in executable_name_list:
     path = FindExecutable( executable_name )